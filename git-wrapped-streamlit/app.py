@@ -3,14 +3,17 @@ GitHub Wrapped - Streamlit App
 Main application file
 """
 
+import hashlib
+from pathlib import Path
+
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
+import numpy as np
 from datetime import datetime
 
-from github_api import fetch_all_github_data, GitHubApiError
-from insights_engine import calculate_insights, get_language_color
+from github_api import fetch_all_github_data, create_session, GitHubApiError
+from insights_engine import calculate_insights, get_language_color, DAYS
 
 
 # ========================================
@@ -29,192 +32,51 @@ st.set_page_config(
 # Custom CSS
 # ========================================
 
-st.markdown("""
-<style>
-    /* Main theme */
-    .stApp {
-        background: linear-gradient(135deg, #0d1117 0%, #161b22 100%);
-    }
-    
-    /* Header styling */
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(135deg, rgba(88, 166, 255, 0.1) 0%, rgba(163, 113, 247, 0.1) 100%);
-        border-radius: 16px;
-        margin-bottom: 2rem;
-        border: 1px solid rgba(88, 166, 255, 0.2);
-    }
-    
-    .main-header h1 {
-        font-size: 3rem;
-        background: linear-gradient(135deg, #58a6ff 0%, #a371f7 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-    }
-    
-    .main-header p {
-        color: #8b949e;
-        font-size: 1.2rem;
-    }
-    
-    /* Stats cards */
-    .stats-card {
-        background: rgba(22, 27, 34, 0.8);
-        border: 1px solid rgba(48, 54, 61, 0.8);
-        border-radius: 12px;
-        padding: 1.5rem;
-        text-align: center;
-        transition: all 0.3s ease;
-    }
-    
-    .stats-card:hover {
-        border-color: #58a6ff;
-        box-shadow: 0 0 20px rgba(88, 166, 255, 0.2);
-    }
-    
-    .stats-emoji {
-        font-size: 1.5rem;
-        margin-bottom: 0.25rem;
-    }
-    
-    .stats-value {
-        font-size: 2.5rem;
-        font-weight: bold;
-        background: linear-gradient(135deg, #58a6ff 0%, #a371f7 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    
-    .stats-label {
-        color: #8b949e;
-        font-size: 0.9rem;
-        margin-top: 0.5rem;
-    }
-    
-    /* Personality card */
-    .personality-card {
-        background: linear-gradient(135deg, rgba(88, 166, 255, 0.1) 0%, rgba(163, 113, 247, 0.1) 100%);
-        border: 1px solid rgba(163, 113, 247, 0.3);
-        border-radius: 16px;
-        padding: 2rem;
-        text-align: center;
-        margin: 1rem 0;
-    }
-    
-    .personality-emoji {
-        font-size: 4rem;
-        margin-bottom: 1rem;
-    }
-    
-    .personality-title {
-        font-size: 2rem;
-        font-weight: bold;
-        background: linear-gradient(135deg, #a371f7 0%, #f778ba 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    
-    .personality-description {
-        color: #8b949e;
-        font-size: 1.1rem;
-        margin-top: 0.5rem;
-    }
-    
-    /* Trait bar */
-    .trait-container {
-        margin: 1rem 0;
-    }
-    
-    .trait-label {
-        display: flex;
-        justify-content: space-between;
-        color: #c9d1d9;
-        margin-bottom: 0.5rem;
-    }
-    
-    .trait-bar {
-        height: 8px;
-        background: rgba(48, 54, 61, 0.8);
-        border-radius: 4px;
-        overflow: hidden;
-    }
-    
-    .trait-fill {
-        height: 100%;
-        background: linear-gradient(90deg, #58a6ff 0%, #a371f7 100%);
-        border-radius: 4px;
-    }
-    
-    /* User profile */
-    .user-profile {
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        padding: 1rem;
-        background: rgba(22, 27, 34, 0.8);
-        border-radius: 12px;
-        border: 1px solid rgba(48, 54, 61, 0.8);
-    }
-    
-    .user-avatar {
-        width: 80px;
-        height: 80px;
-        border-radius: 50%;
-        border: 3px solid #58a6ff;
-    }
-    
-    .user-info h3 {
-        color: #c9d1d9;
-        margin: 0;
-    }
-    
-    .user-info p {
-        color: #8b949e;
-        margin: 0;
-    }
-    
-    /* Repo card */
-    .repo-card {
-        background: rgba(22, 27, 34, 0.8);
-        border: 1px solid rgba(48, 54, 61, 0.8);
-        border-radius: 12px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-    }
-    
-    .repo-card:hover {
-        border-color: #58a6ff;
-    }
-    
-    .repo-name {
-        color: #58a6ff;
-        font-weight: bold;
-        text-decoration: none;
-    }
-    
-    .repo-description {
-        color: #8b949e;
-        font-size: 0.9rem;
-        margin-top: 0.5rem;
-    }
-    
-    /* Section header */
-    .section-header {
-        color: #c9d1d9;
-        font-size: 1.5rem;
-        font-weight: bold;
-        margin: 2rem 0 1rem 0;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid rgba(88, 166, 255, 0.3);
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
+CSS_PATH = Path(__file__).parent / "style.css"
+
+
+@st.cache_resource
+def _load_css():
+    """Read the app stylesheet once per process"""
+    return f"<style>\n{CSS_PATH.read_text(encoding='utf-8')}</style>"
+
+
+# Streamlit drops any element that is not re-emitted on a rerun, so the
+# style tag is still written every run; only the file read is cached.
+st.markdown(_load_css(), unsafe_allow_html=True)
+
+
+# ========================================
+# Cached Data Access
+# ========================================
+
+def _token_signature(token):
+    """Short, non-reversible fingerprint of a token for use in cache keys"""
+    if not token:
+        return ""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+@st.cache_resource
+def get_http_session():
+    """Process-wide HTTP session so every user session shares one connection pool"""
+    return create_session()
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_fetch(username, year, token_sig, _token=None):
+    """Fetch GitHub data, cached per (username, year, token signature).
+
+    The raw token is passed as an underscore-prefixed argument so Streamlit
+    excludes it from the cache key; only its signature is hashed.
+    """
+    return fetch_all_github_data(username, year, _token, session=get_http_session())
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_insights(username, year, token_sig, _data):
+    """Calculate insights, cached alongside the data they were derived from"""
+    return calculate_insights(_data, year)
 
 
 # ========================================
@@ -238,9 +100,27 @@ def render_personality_card(personality):
     """, unsafe_allow_html=True)
 
 
+def render_repo_html(repo):
+    """Build the HTML for a repository card"""
+    lang_badge = ""
+    if repo.language:
+        color = get_language_color(repo.language)
+        lang_badge = f'<span style="color: {color};">●</span> {repo.language}'
+    commits = f' • {repo.commits} commits' if repo.commits else ''
+    
+    return f"""
+        <div class="repo-card">
+            <a href="{repo.url}" target="_blank" class="repo-name">{repo.name}</a>
+            <span style="float: right; color: #8b949e;">⭐ {repo.stars}</span>
+            <div class="repo-description">{repo.description or 'No description'}</div>
+            <div style="margin-top: 0.5rem; color: #8b949e; font-size: 0.8rem;">{lang_badge}{commits}</div>
+        </div>
+    """
+
+
 def render_trait_bar(trait):
-    """Render a personality trait bar"""
-    st.markdown(f"""
+    """Build the HTML for a personality trait bar"""
+    return f"""
         <div class="trait-container">
             <div class="trait-label">
                 <span>{trait.name}</span>
@@ -250,37 +130,83 @@ def render_trait_bar(trait):
                 <div class="trait-fill" style="width: {trait.value}%;"></div>
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+# Static landing page markup
+LANDING_HTML = """
+    <div style="text-align: center; padding: 4rem 2rem;">
+        <div style="font-size: 5rem; margin-bottom: 1rem;">🎁</div>
+        <h1 style="font-size: 3rem; background: linear-gradient(135deg, #58a6ff 0%, #a371f7 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">
+            GitHub Wrapped
+        </h1>
+        <p style="color: #8b949e; font-size: 1.3rem; max-width: 600px; margin: 1rem auto;">
+            Discover your GitHub highlights, stats, and coding personality<br>
+            wrapped up in a beautiful dashboard.
+        </p>
+        <div style="display: flex; justify-content: center; gap: 2rem; margin-top: 2rem; flex-wrap: wrap;">
+            <div style="color: #8b949e;">📊 Contribution Stats</div>
+            <div style="color: #8b949e;">💻 Top Languages</div>
+            <div style="color: #8b949e;">🔥 Streak Analysis</div>
+            <div style="color: #8b949e;">🎭 Developer Personality</div>
+        </div>
+        <p style="color: #6e7681; margin-top: 3rem;">
+            👈 Enter a GitHub username in the sidebar to get started
+        </p>
+    </div>
+"""
+
+
+ACTIVITY_COLORSCALE = [(0, '#161b22'), (0.5, '#58a6ff'), (1, '#a371f7')]
+
 
+def interpolate_color(stops, t):
+    """Linearly interpolate a hex color at position t (0-1) on a colorscale"""
+    for (t0, c0), (t1, c1) in zip(stops, stops[1:]):
+        if t <= t1:
+            break
+    f = (t - t0) / (t1 - t0) if t1 > t0 else 0
+    rgb0 = [int(c0[i:i + 2], 16) for i in (1, 3, 5)]
+    rgb1 = [int(c1[i:i + 2], 16) for i in (1, 3, 5)]
+    return '#{:02x}{:02x}{:02x}'.format(*(round(a + (b - a) * f) for a, b in zip(rgb0, rgb1)))
 
-def create_contribution_heatmap(calendar, year):
-    """Create a contribution heatmap using Plotly"""
-    if not calendar or not calendar.weeks:
+
+# Chart builders are pure functions of their tuple inputs. They are cached
+# with st.cache_resource so a rerun hands the already-built figure straight
+# to st.plotly_chart, skipping the pickle round-trip st.cache_data would do
+# on every hit. Callers must not mutate the returned figures.
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def create_contribution_heatmap(days, year):
+    """Create a contribution heatmap using Plotly
+
+    `days` is a tuple of (date, contribution_count) pairs, already limited
+    to `year`, so the figure can be cached by value across reruns.
+    """
+    if not days:
         return None
     
     # Prepare data
-    dates = []
-    counts = []
+    dates = np.array([date[:10] for date, _ in days], dtype='datetime64[D]')
+    counts = np.fromiter((count for _, count in days), dtype=np.int32, count=len(days))
     
-    for week in calendar.weeks:
-        for day in week:
-            dates.append(day.date)
-            counts.append(day.contribution_count)
+    # Day ordinals since the epoch; 1970-01-01 was a Thursday (Sunday = 0)
+    ordinals = dates.view('i8')
+    weekday = (ordinals + 4) % 7
     
-    # Create dataframe
-    df = pd.DataFrame({'date': dates, 'contributions': counts})
-    df['date'] = pd.to_datetime(df['date'])
-    df['week'] = df['date'].dt.isocalendar().week
-    df['weekday'] = df['date'].dt.weekday
+    # Week column in a Sunday-start grid, as on GitHub's profile calendar
+    jan1 = np.datetime64(f'{year}-01-01', 'D').view('i8')
+    week = (ordinals - jan1 + (jan1 + 4) % 7) // 7
     
-    # Filter for the selected year
-    df = df[df['date'].dt.year == year]
+    # Dense weekday x week grid; days outside the year stay blank
+    grid = np.full((7, int(week.max()) + 1), np.nan)
+    grid[weekday, week] = counts
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
-        x=df['week'],
-        y=df['weekday'],
-        z=df['contributions'],
+        z=grid,
+        x0=1,
+        dx=1,
         colorscale=[
             [0, '#161b22'],
             [0.25, '#0e4429'],
@@ -304,7 +230,8 @@ def create_contribution_heatmap(calendar, year):
         ),
         yaxis=dict(
             ticktext=['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'],
-            tickvals=[6, 5, 4, 3, 2, 1, 0],
+            tickvals=[0, 1, 2, 3, 4, 5, 6],
+            autorange='reversed',
             showgrid=False,
             tickfont=dict(color='#8b949e', size=10),
         ),
@@ -313,14 +240,18 @@ def create_contribution_heatmap(calendar, year):
     return fig
 
 
+@st.cache_resource(max_entries=32, show_spinner=False)
 def create_language_chart(languages):
-    """Create a language distribution donut chart"""
+    """Create a language distribution donut chart
+
+    `languages` is a tuple of (name, count, color) triples.
+    """
     if not languages:
         return None
     
-    names = [lang.name for lang in languages]
-    values = [lang.count for lang in languages]
-    colors = [lang.color for lang in languages]
+    names = [name for name, _, _ in languages]
+    values = [count for _, count, _ in languages]
+    colors = [color for _, _, color in languages]
     
     fig = go.Figure(data=[go.Pie(
         labels=names,
@@ -350,18 +281,26 @@ def create_language_chart(languages):
     return fig
 
 
-def create_activity_chart(activity_by_day):
-    """Create an activity by day bar chart"""
-    days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-    values = [activity_by_day.get(day, 0) for day in days]
+@st.cache_resource(max_entries=32, show_spinner=False)
+def create_activity_chart(values):
+    """Create an activity by day bar chart
+
+    `values` is a tuple of seven contribution counts, Sunday first.
+    """
+    values = list(values)
+    
+    # Map values onto the colorscale here, using the same min-max range
+    # Plotly would, so only the seven resulting colors are shipped
+    low, high = min(values), max(values)
+    colors = [
+        interpolate_color(ACTIVITY_COLORSCALE, (v - low) / (high - low) if high > low else 0)
+        for v in values
+    ]
     
     fig = go.Figure(data=[go.Bar(
         x=['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'],
         y=values,
-        marker=dict(
-            color=values,
-            colorscale=[[0, '#161b22'], [0.5, '#58a6ff'], [1, '#a371f7']],
-        ),
+        marker_color=colors,
         hovertemplate='%{x}: %{y} contributions<extra></extra>',
     )])
     
@@ -383,10 +322,14 @@ def create_activity_chart(activity_by_day):
     return fig
 
 
+@st.cache_resource(max_entries=32, show_spinner=False)
 def create_monthly_chart(monthly_activity):
-    """Create a monthly activity area chart"""
-    months = [m.month for m in monthly_activity]
-    values = [m.contributions for m in monthly_activity]
+    """Create a monthly activity area chart
+
+    `monthly_activity` is a tuple of (month, contributions) pairs.
+    """
+    months = [month for month, _ in monthly_activity]
+    values = [contributions for _, contributions in monthly_activity]
     
     fig = go.Figure(data=[go.Scatter(
         x=months,
@@ -425,43 +368,47 @@ with st.sidebar:
     st.markdown("## 🎁 GitHub Wrapped")
     st.markdown("---")
     
-    # Username input
-    username = st.text_input(
-        "GitHub Username",
-        placeholder="Enter username...",
-        help="Enter a GitHub username to see their year in review"
-    )
-    
-    # Year selector
-    current_year = datetime.now().year
-    year = st.selectbox(
-        "Year",
-        options=list(range(current_year, current_year - 5, -1)),
-        index=0,
-    )
-    
-    # Optional GitHub token
-    with st.expander("🔑 GitHub Token (Optional)"):
-        st.markdown("""
-            <small style="color: #8b949e;">
-            A personal access token enables more detailed stats via the GraphQL API.
-            Create one at <a href="https://github.com/settings/tokens" target="_blank">GitHub Settings</a>.
-            </small>
-        """, unsafe_allow_html=True)
-        token = st.text_input(
-            "Token",
-            type="password",
-            placeholder="ghp_...",
-            label_visibility="collapsed",
+    # Inputs live in a form so typing doesn't rerun the script; only
+    # submitting it does
+    with st.form("generate", clear_on_submit=False):
+        # Username input
+        username = st.text_input(
+            "GitHub Username",
+            placeholder="Enter username...",
+            help="Enter a GitHub username to see their year in review"
         )
-    
-    # Generate button
-    generate_clicked = st.button(
-        "✨ Generate Wrapped",
-        type="primary",
-        use_container_width=True,
-        disabled=not username.strip(),
-    )
+        
+        # Year selector
+        current_year = datetime.now().year
+        year = st.selectbox(
+            "Year",
+            options=list(range(current_year, current_year - 5, -1)),
+            index=0,
+        )
+        
+        # Optional GitHub token
+        with st.expander("🔑 GitHub Token (Optional)"):
+            st.markdown("""
+                <small style="color: #8b949e;">
+                A personal access token enables more detailed stats via the GraphQL API.
+                Create one at <a href="https://github.com/settings/tokens" target="_blank">GitHub Settings</a>.
+                </small>
+            """, unsafe_allow_html=True)
+            token = st.text_input(
+                "Token",
+                type="password",
+                placeholder="ghp_...",
+                label_visibility="collapsed",
+            )
+        
+        # Generate button
+        generate_clicked = st.form_submit_button(
+            "✨ Generate Wrapped",
+            type="primary",
+            use_container_width=True,
+        )
+        if generate_clicked and not username.strip():
+            st.warning("Enter a GitHub username first.")
     
     st.markdown("---")
     st.markdown("""
@@ -489,12 +436,17 @@ if 'current_year' not in st.session_state:
 if generate_clicked and username.strip():
     with st.spinner(f"Fetching data for @{username}..."):
         try:
-            data = fetch_all_github_data(
-                username.strip(),
+            # Logins are case-insensitive, so differently-cased entries of the
+            # same user share one cache entry
+            login = username.strip().lower()
+            token_sig = _token_signature(token)
+            data = _cached_fetch(
+                login,
                 year,
-                token if token else None
+                token_sig,
+                _token=token if token else None,
             )
-            insights = calculate_insights(data, year)
+            insights = _cached_insights(login, year, token_sig, data)
             st.session_state.insights = insights
             st.session_state.user = data.user
             st.session_state.current_username = username.strip()
@@ -545,7 +497,17 @@ if st.session_state.insights and st.session_state.user:
     # Contribution Heatmap
     st.markdown('<div class="section-header">📅 Contribution Calendar</div>', unsafe_allow_html=True)
     
-    heatmap = create_contribution_heatmap(insights.contribution_calendar, display_year)
+    # ISO dates are year-prefixed, so a string check filters out the
+    # neighbouring-year days in the calendar's partial first/last weeks
+    calendar = insights.contribution_calendar
+    year_prefix = f"{display_year}-"
+    calendar_days = tuple(
+        (day.date, day.contribution_count)
+        for week in calendar.weeks
+        for day in week
+        if day.date.startswith(year_prefix)
+    ) if calendar else ()
+    heatmap = create_contribution_heatmap(calendar_days, display_year)
     if heatmap:
         st.plotly_chart(heatmap, use_container_width=True, config={'displayModeBar': False})
     
@@ -565,7 +527,9 @@ if st.session_state.insights and st.session_state.user:
     
     with col1:
         st.markdown('<div class="section-header">💻 Top Languages</div>', unsafe_allow_html=True)
-        lang_chart = create_language_chart(insights.top_languages)
+        lang_chart = create_language_chart(tuple(
+            (lang.name, lang.count, lang.color) for lang in insights.top_languages
+        ))
         if lang_chart:
             st.plotly_chart(lang_chart, use_container_width=True, config={'displayModeBar': False})
         else:
@@ -573,7 +537,9 @@ if st.session_state.insights and st.session_state.user:
     
     with col2:
         st.markdown('<div class="section-header">📈 Activity by Day</div>', unsafe_allow_html=True)
-        activity_chart = create_activity_chart(insights.activity_by_day)
+        activity_chart = create_activity_chart(tuple(
+            insights.activity_by_day.get(day, 0) for day in DAYS
+        ))
         st.plotly_chart(activity_chart, use_container_width=True, config={'displayModeBar': False})
         
         st.markdown(f"""
@@ -585,32 +551,19 @@ if st.session_state.insights and st.session_state.user:
     
     # Monthly Activity
     st.markdown('<div class="section-header">📊 Monthly Activity</div>', unsafe_allow_html=True)
-    monthly_chart = create_monthly_chart(insights.monthly_activity)
+    monthly_chart = create_monthly_chart(tuple(
+        (m.month, m.contributions) for m in insights.monthly_activity
+    ))
     st.plotly_chart(monthly_chart, use_container_width=True, config={'displayModeBar': False})
     
     # Top Repositories
     if insights.top_repositories:
         st.markdown('<div class="section-header">⭐ Top Repositories</div>', unsafe_allow_html=True)
         
-        cols = st.columns(2)
-        for i, repo in enumerate(insights.top_repositories[:6]):
-            with cols[i % 2]:
-                lang_badge = ""
-                if repo.language:
-                    color = get_language_color(repo.language)
-                    lang_badge = f'<span style="color: {color};">●</span> {repo.language}'
-                
-                st.markdown(f"""
-                    <div class="repo-card">
-                        <a href="{repo.url}" target="_blank" class="repo-name">{repo.name}</a>
-                        <span style="float: right; color: #8b949e;">⭐ {repo.stars}</span>
-                        <div class="repo-description">{repo.description or 'No description'}</div>
-                        <div style="margin-top: 0.5rem; color: #8b949e; font-size: 0.8rem;">
-                            {lang_badge}
-                            {f' • {repo.commits} commits' if repo.commits else ''}
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
+        top_repos = insights.top_repositories[:6]
+        col1, col2 = st.columns(2)
+        col1.markdown("".join(render_repo_html(r) for r in top_repos[0::2]), unsafe_allow_html=True)
+        col2.markdown("".join(render_repo_html(r) for r in top_repos[1::2]), unsafe_allow_html=True)
     
     # Developer Personality
     st.markdown('<div class="section-header">🎭 Developer Personality</div>', unsafe_allow_html=True)
@@ -622,8 +575,10 @@ if st.session_state.insights and st.session_state.user:
     
     with col2:
         st.markdown("<br>", unsafe_allow_html=True)
-        for trait in insights.personality.traits:
-            render_trait_bar(trait)
+        st.markdown(
+            "".join(render_trait_bar(t) for t in insights.personality.traits),
+            unsafe_allow_html=True,
+        )
     
     # Footer
     st.markdown("<br><br>", unsafe_allow_html=True)
@@ -636,24 +591,4 @@ if st.session_state.insights and st.session_state.user:
 
 else:
     # Landing page
-    st.markdown("""
-        <div style="text-align: center; padding: 4rem 2rem;">
-            <div style="font-size: 5rem; margin-bottom: 1rem;">🎁</div>
-            <h1 style="font-size: 3rem; background: linear-gradient(135deg, #58a6ff 0%, #a371f7 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">
-                GitHub Wrapped
-            </h1>
-            <p style="color: #8b949e; font-size: 1.3rem; max-width: 600px; margin: 1rem auto;">
-                Discover your GitHub highlights, stats, and coding personality<br>
-                wrapped up in a beautiful dashboard.
-            </p>
-            <div style="display: flex; justify-content: center; gap: 2rem; margin-top: 2rem; flex-wrap: wrap;">
-                <div style="color: #8b949e;">📊 Contribution Stats</div>
-                <div style="color: #8b949e;">💻 Top Languages</div>
-                <div style="color: #8b949e;">🔥 Streak Analysis</div>
-                <div style="color: #8b949e;">🎭 Developer Personality</div>
-            </div>
-            <p style="color: #6e7681; margin-top: 3rem;">
-                👈 Enter a GitHub username in the sidebar to get started
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(LANDING_HTML, unsafe_allow_html=True)
@@ -3,17 +3,30 @@ GitHub API Service Layer
 Port of src/api/github.ts
 """
 
+import hashlib
+import itertools
+import os
+import threading
+import time
+import numpy as np
+import orjson
 import requests
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from datetime import date
 
 
 # ========================================
 # Data Classes
 # ========================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitHubUser:
     login: str
     id: int
@@ -33,7 +46,7 @@ class GitHubUser:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitHubRepo:
     id: int
     name: str
@@ -52,10 +65,10 @@ class GitHubRepo:
     forks_count: int
     open_issues_count: int
     default_branch: str
-    topics: List[str]
+    topics: Tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubEvent:
     id: str
     type: str
@@ -66,20 +79,20 @@ class GitHubEvent:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContributionDay:
     date: str
     contribution_count: int
     contribution_level: str  # NONE, FIRST_QUARTILE, SECOND_QUARTILE, THIRD_QUARTILE, FOURTH_QUARTILE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContributionCalendar:
     total_contributions: int
-    weeks: List[List[ContributionDay]]  # List of weeks, each week is list of days
+    weeks: Tuple[Tuple[ContributionDay, ...], ...]  # Weeks, each a tuple of days
 
 
-@dataclass
+@dataclass(slots=True)
 class ContributionData:
     total_commit_contributions: int
     total_pull_request_contributions: int
@@ -90,6 +103,11 @@ class ContributionData:
     commit_contributions_by_repository: List[Dict[str, Any]]
 
 
+# Shared default for absent topic lists, so repos without topics don't
+# each allocate an empty container
+_EMPTY: Tuple[str, ...] = ()
+
+
 # ========================================
 # API Configuration
 # ========================================
@@ -98,6 +116,14 @@ GITHUB_API_BASE = "https://api.github.com"
 GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 CONTRIBUTION_FALLBACK_API = "https://github-contributions-api.jogruber.de/v4"
 
+REQUEST_TIMEOUT = 30  # seconds
+RATE_LIMIT_RETRIES = 2
+MAX_RETRY_AFTER = 10  # seconds; longer waits surface as a rate-limit error
+MAX_CONCURRENT_REQUESTS = 4
+MAX_EVENT_PAGES = 3  # the events API serves at most 300 events
+ETAG_CACHE_SIZE = 256  # responses kept for conditional requests
+TOKEN_MIN_REMAINING = 50  # pooled tokens below this are rested until reset
+
 
 class GitHubApiError(Exception):
     """Custom exception for GitHub API errors"""
@@ -108,25 +134,251 @@ class GitHubApiError(Exception):
         super().__init__(message)
 
 
+# ========================================
+# HTTP Session
+# ========================================
+
+def create_session() -> requests.Session:
+    """Create a pooled session with the default GitHub headers"""
+    session = requests.Session()
+    # Responses are compressed on request; GitHub doesn't accept compressed
+    # request bodies, so the GraphQL query is minified instead
+    session.headers.update({
+        "Accept": "application/vnd.github.v3+json",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    
+    # Keep enough connections per host for the concurrent fetches, and retry
+    # transient gateway errors; every POST sent here is a read-only query
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            # Hand the last response back rather than raising RetryError, so
+            # callers' status checks still decide what a failure means
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Default for callers that don't supply a session; shared across calls so
+# connections (and their TLS handshakes) are reused
+_SESSION = create_session()
+
+
+class TokenPool:
+    """Server-side tokens handed out round-robin to unauthenticated requests.
+
+    Each token's remaining quota is tracked from the X-RateLimit headers of
+    the responses it was used for; a token running low is skipped until its
+    window resets, and one the API rejects is dropped for good.
+    """
+    
+    def __init__(self, tokens: List[str], min_remaining: int = TOKEN_MIN_REMAINING):
+        self._tokens = [t for t in tokens if t]
+        self._cycle = itertools.cycle(self._tokens)
+        self._min_remaining = min_remaining
+        self._limits: Dict[str, Tuple[int, float]] = {}  # token -> (remaining, reset)
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls, var: str = "GITHUB_TOKENS") -> "TokenPool":
+        """Build a pool from a comma-separated environment variable"""
+        return cls([t.strip() for t in os.environ.get(var, "").split(",")])
+    
+    def __bool__(self) -> bool:
+        return bool(self._tokens)
+    
+    def acquire(self) -> Optional[str]:
+        """Next token with quota left, or None if every token is exhausted"""
+        now = time.time()
+        with self._lock:
+            for _ in range(len(self._tokens)):
+                token = next(self._cycle)
+                remaining, reset = self._limits.get(token, (self._min_remaining, 0.0))
+                if remaining >= self._min_remaining or now >= reset:
+                    return token
+        return None
+    
+    def update(self, token: str, headers: Any) -> None:
+        """Record the quota reported by a response sent with ``token``"""
+        remaining = headers.get("X-RateLimit-Remaining", "")
+        reset = headers.get("X-RateLimit-Reset", "")
+        if remaining.isdigit() and reset.isdigit():
+            with self._lock:
+                self._limits[token] = (int(remaining), float(reset))
+    
+    def discard(self, token: str) -> None:
+        """Take a revoked or invalid token out of rotation"""
+        with self._lock:
+            if token in self._tokens:
+                self._tokens.remove(token)
+                self._cycle = itertools.cycle(self._tokens)
+                self._limits.pop(token, None)
+
+
+# Shared by every session; empty unless GITHUB_TOKENS is configured
+_TOKEN_POOL = TokenPool.from_env()
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedResponse:
+    """The parts of a response needed to replay it after a 304.
+
+    The response itself is not kept: its request still carries the
+    Authorization header, and so the raw token.
+    """
+    etag: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    
+    def to_response(self, url: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = url
+        return response
+
+
+# Last successful response per GET, kept so repeat fetches can be made
+# conditional: a 304 reply costs no body and, when authenticated, no rate
+# limit, and the cached response is handed back in its place
+_ETAG_CACHE: "OrderedDict[Tuple[str, str, str], _CachedResponse]" = OrderedDict()
+_ETAG_CACHE_LOCK = threading.Lock()
+
+
+def _etag_cache_key(url: str, params: Any, token: Optional[str]) -> Tuple[str, str, str]:
+    """Cache key for a GET; the token only contributes a short digest"""
+    token_sig = hashlib.sha256(token.encode()).hexdigest()[:16] if token else ""
+    return url, repr(sorted((params or {}).items())), token_sig
+
+
+def _request(
+    session: Optional[requests.Session],
+    method: str,
+    url: str,
+    token: Optional[str] = None,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a request on the shared session, revalidating GETs by ETag.
+
+    The token is sent per request rather than stored on the session, since
+    the session is shared between users. Without one, GitHub API requests
+    borrow a token from the server's pool, if one is configured, except for
+    event feeds: those include private events when the token's owner is the
+    user being looked up, which must not leak to anonymous visitors. A pooled
+    token the API rejects is dropped and the request sent again with the
+    next one, or anonymously once none are left.
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    request_headers = kwargs.pop("headers", None)
+    headers = dict(request_headers or {})
+    pooled = None
+    if (
+        not token
+        and _TOKEN_POOL
+        and url.startswith(GITHUB_API_BASE)
+        and not url.endswith("/events")
+    ):
+        pooled = _TOKEN_POOL.acquire()
+    if token or pooled:
+        headers["Authorization"] = f"Bearer {token or pooled}"
+    
+    cached = None
+    if method == "GET":
+        # A response is only ever reused for the credentials it was fetched
+        # with, pooled tokens included, since what a token can see depends
+        # on its owner
+        key = _etag_cache_key(url, kwargs.get("params"), token or pooled)
+        with _ETAG_CACHE_LOCK:
+            cached = _ETAG_CACHE.get(key)
+        if cached is not None:
+            headers["If-None-Match"] = cached.etag
+    
+    response = _send(session, method, url, headers=headers, **kwargs)
+    if pooled:
+        if response.status_code == 401:
+            _TOKEN_POOL.discard(pooled)
+            return _request(session, method, url, headers=request_headers, **kwargs)
+        _TOKEN_POOL.update(pooled, response.headers)
+    
+    if method != "GET":
+        return response
+    
+    if response.status_code == 304 and cached is not None:
+        with _ETAG_CACHE_LOCK:
+            _ETAG_CACHE.move_to_end(key)
+        return cached.to_response(url)
+    if response.status_code == 200 and response.headers.get("ETag"):
+        entry = _CachedResponse(
+            response.headers["ETag"],
+            response.status_code,
+            dict(response.headers),
+            response.content,
+        )
+        with _ETAG_CACHE_LOCK:
+            _ETAG_CACHE[key] = entry
+            _ETAG_CACHE.move_to_end(key)
+            while len(_ETAG_CACHE) > ETAG_CACHE_SIZE:
+                _ETAG_CACHE.popitem(last=False)
+    return response
+
+
+def _send(
+    session: Optional[requests.Session],
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a request, honouring short Retry-After waits.
+
+    GitHub answers secondary rate limits with 403/429 and a Retry-After
+    header; those are retried after the advised delay. Primary rate limits
+    (no Retry-After, reset up to an hour away) are returned as-is.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        response = (session or _SESSION).request(method, url, **kwargs)
+        if response.status_code not in (403, 429) or attempt == RATE_LIMIT_RETRIES:
+            return response
+        
+        retry_after = response.headers.get("Retry-After", "")
+        if not retry_after.isdigit() or int(retry_after) > MAX_RETRY_AFTER:
+            return response
+        time.sleep(int(retry_after))
+    
+    return response
+
+
 # ========================================
 # API Functions
 # ========================================
 
-def fetch_user_profile(username: str) -> GitHubUser:
+def fetch_user_profile(
+    username: str,
+    session: Optional[requests.Session] = None,
+    token: Optional[str] = None,
+) -> GitHubUser:
     """Fetch user profile from GitHub API"""
-    response = requests.get(
-        f"{GITHUB_API_BASE}/users/{username}",
-        headers={"Accept": "application/vnd.github.v3+json"}
-    )
+    response = _request(session, "GET", f"{GITHUB_API_BASE}/users/{username}", token=token)
     
     if response.status_code == 404:
         raise GitHubApiError("User not found", 404, "NOT_FOUND")
+    if response.status_code == 401:
+        raise GitHubApiError("Invalid GitHub token", 401, "UNAUTHORIZED")
     if response.status_code == 403:
         raise GitHubApiError("API rate limit exceeded", 403, "RATE_LIMITED")
     if not response.ok:
         raise GitHubApiError(f"GitHub API error: {response.status_code}", response.status_code)
     
-    data = response.json()
+    data = orjson.loads(response.content)
     return GitHubUser(
         login=data["login"],
         id=data["id"],
@@ -147,47 +399,61 @@ def fetch_user_profile(username: str) -> GitHubUser:
     )
 
 
-def fetch_user_repos(username: str, max_repos: int = 100) -> List[GitHubRepo]:
+def fetch_user_repos(
+    username: str,
+    max_repos: int = 100,
+    session: Optional[requests.Session] = None,
+    token: Optional[str] = None,
+) -> List[GitHubRepo]:
     """Fetch user repositories with pagination"""
     repos = []
     page = 1
-    per_page = 100
+    # Page offsets are per_page * (page - 1), so the page size has to stay
+    # fixed across pages; request no more than max_repos in each
+    per_page = min(100, max_repos)
+    # Positional construction through a local name keeps the per-repo cost
+    # down for users with hundreds of repos
+    repo_cls = GitHubRepo
     
     while len(repos) < max_repos:
-        response = requests.get(
+        response = _request(
+            session,
+            "GET",
             f"{GITHUB_API_BASE}/users/{username}/repos",
+            token=token,
             params={"per_page": per_page, "page": page, "sort": "updated", "type": "owner"},
-            headers={"Accept": "application/vnd.github.v3+json"}
         )
         
         if not response.ok:
             break
             
-        page_repos = response.json()
+        page_repos = orjson.loads(response.content)
         if not page_repos:
             break
             
-        for repo in page_repos:
-            repos.append(GitHubRepo(
-                id=repo["id"],
-                name=repo["name"],
-                full_name=repo["full_name"],
-                html_url=repo["html_url"],
-                description=repo.get("description"),
-                fork=repo.get("fork", False),
-                created_at=repo["created_at"],
-                updated_at=repo["updated_at"],
-                pushed_at=repo.get("pushed_at", repo["updated_at"]),
-                homepage=repo.get("homepage"),
-                size=repo.get("size", 0),
-                stargazers_count=repo.get("stargazers_count", 0),
-                watchers_count=repo.get("watchers_count", 0),
-                language=repo.get("language"),
-                forks_count=repo.get("forks_count", 0),
-                open_issues_count=repo.get("open_issues_count", 0),
-                default_branch=repo.get("default_branch", "main"),
-                topics=repo.get("topics", []),
-            ))
+        repos.extend(
+            repo_cls(
+                repo["id"],
+                repo["name"],
+                repo["full_name"],
+                repo["html_url"],
+                repo.get("description"),
+                repo.get("fork", False),
+                repo["created_at"],
+                repo["updated_at"],
+                repo.get("pushed_at", repo["updated_at"]),
+                repo.get("homepage"),
+                repo.get("size", 0),
+                repo.get("stargazers_count", 0),
+                repo.get("watchers_count", 0),
+                repo.get("language"),
+                repo.get("forks_count", 0),
+                repo.get("open_issues_count", 0),
+                repo.get("default_branch", "main"),
+                tuple(repo["topics"]) if repo.get("topics") else _EMPTY,
+            )
+            for repo in page_repos
+        )
         
         page += 1
         if len(page_repos) < per_page:
@@ -196,71 +462,114 @@ def fetch_user_repos(username: str, max_repos: int = 100) -> List[GitHubRepo]:
     return repos[:max_repos]
 
 
-def fetch_user_events(username: str, max_events: int = 300) -> List[GitHubEvent]:
-    """Fetch user events with pagination (max 300 from API)"""
-    events = []
-    page = 1
+def _fetch_events_page(
+    username: str,
+    page: int,
+    per_page: int,
+    session: Optional[requests.Session],
+    token: Optional[str],
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch one page of raw user events, or None if the request fails"""
+    try:
+        response = _request(
+            session,
+            "GET",
+            f"{GITHUB_API_BASE}/users/{username}/events",
+            token=token,
+            params={"per_page": per_page, "page": page},
+        )
+        if not response.ok:
+            return None
+        return orjson.loads(response.content)
+    except Exception:
+        return None
+
+
+def _submit_event_pages(
+    executor: Executor,
+    username: str,
+    max_events: int = 300,
+    session: Optional[requests.Session] = None,
+    token: Optional[str] = None,
+) -> List["Future[Optional[List[Dict[str, Any]]]]"]:
+    """Queue every events page needed for max_events on the executor"""
     per_page = 100
-    
-    while len(events) < max_events and page <= 3:
-        try:
-            response = requests.get(
-                f"{GITHUB_API_BASE}/users/{username}/events",
-                params={"per_page": per_page, "page": page},
-                headers={"Accept": "application/vnd.github.v3+json"}
-            )
-            
-            if not response.ok:
-                break
-                
-            page_events = response.json()
-            if not page_events:
-                break
-                
-            for event in page_events:
-                events.append(GitHubEvent(
-                    id=event["id"],
-                    type=event["type"],
-                    actor=event["actor"],
-                    repo=event["repo"],
-                    payload=event.get("payload", {}),
-                    public=event.get("public", True),
-                    created_at=event["created_at"],
-                ))
-            
-            page += 1
-        except Exception:
+    max_pages = min(MAX_EVENT_PAGES, -(-max_events // per_page))
+    return [
+        executor.submit(_fetch_events_page, username, page, per_page, session, token)
+        for page in range(1, max_pages + 1)
+    ]
+
+
+def _collect_events(page_futures: List["Future[Optional[List[Dict[str, Any]]]]"]) -> List[GitHubEvent]:
+    """Events from the pages in order, up to the first failed or empty one"""
+    events = []
+    event_cls = GitHubEvent
+    for future in page_futures:
+        page_events = future.result()
+        if not page_events:
             break
+            
+        events.extend(
+            event_cls(
+                event["id"],
+                event["type"],
+                event["actor"],
+                event["repo"],
+                event.get("payload") or {},
+                event.get("public", True),
+                event["created_at"],
+            )
+            for event in page_events
+        )
     
     return events
 
 
-def fetch_contribution_calendar_fallback(username: str, year: int) -> Optional[ContributionCalendar]:
+def fetch_user_events(
+    username: str,
+    max_events: int = 300,
+    session: Optional[requests.Session] = None,
+    token: Optional[str] = None,
+) -> List[GitHubEvent]:
+    """Fetch user events with pagination (max 300 from API)"""
+    # The API caps events at three pages, so request them all at once
+    with ThreadPoolExecutor(max_workers=MAX_EVENT_PAGES) as executor:
+        return _collect_events(
+            _submit_event_pages(executor, username, max_events, session=session, token=token)
+        )
+
+
+def _parse_day(value: str) -> date:
+    """Date part of a "YYYY-MM-DD..." string, without full ISO parsing"""
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+def fetch_contribution_calendar_fallback(
+    username: str,
+    year: int,
+    session: Optional[requests.Session] = None,
+) -> Optional[ContributionCalendar]:
     """Fetch contribution calendar via fallback API"""
     try:
-        response = requests.get(f"{CONTRIBUTION_FALLBACK_API}/{username}?y={year}")
+        response = _request(
+            session,
+            "GET",
+            f"{CONTRIBUTION_FALLBACK_API}/{username}",
+            params={"y": year},
+        )
         
         if not response.ok:
             return None
             
-        data = response.json()
+        data = orjson.loads(response.content)
         
-        weeks = []
+        days = []
         total_contributions = 0
-        current_week = []
+        day_cls = ContributionDay
         
         contributions = data.get("contributions", [])
         for contrib in contributions:
-            date = datetime.fromisoformat(contrib["date"].replace("Z", "+00:00"))
-            day_of_week = date.weekday()  # 0 = Monday, 6 = Sunday
-            # Convert to Sunday = 0 format
-            day_of_week = (day_of_week + 1) % 7
-            
-            # Start new week on Sunday
-            if day_of_week == 0 and current_week:
-                weeks.append(current_week)
-                current_week = []
-            
             count = contrib.get("count", 0)
             total_contributions += count
             
@@ -276,15 +585,15 @@ def fetch_contribution_calendar_fallback(username: str, year: int) -> Optional[C
             else:
                 level = "FOURTH_QUARTILE"
             
-            current_week.append(ContributionDay(
-                date=contrib["date"],
-                contribution_count=count,
-                contribution_level=level,
-            ))
+            days.append(day_cls(contrib["date"], count, level))
         
-        # Push last week
-        if current_week:
-            weeks.append(current_week)
+        # The days are contiguous, so only the first needs parsing: weeks start
+        # on Sunday, and the first week is short by its weekday (Sunday = 0)
+        first_weekday = (_parse_day(days[0].date).weekday() + 1) % 7 if days else 0
+        weeks = tuple(
+            tuple(days[max(0, start):start + 7])
+            for start in range(-first_weekday, len(days), 7)
+        )
         
         return ContributionCalendar(
             total_contributions=data.get("total", {}).get(str(year), total_contributions),
@@ -295,135 +604,367 @@ def fetch_contribution_calendar_fallback(username: str, year: int) -> Optional[C
         return None
 
 
-def fetch_contribution_data_graphql(
-    username: str, 
-    year: int, 
-    token: str
-) -> Optional[ContributionData]:
-    """Fetch detailed contribution data via GraphQL API"""
-    query = """
-    query($username: String!, $from: DateTime!, $to: DateTime!) {
-      user(login: $username) {
-        contributionsCollection(from: $from, to: $to) {
-          totalCommitContributions
-          totalPullRequestContributions
-          totalIssueContributions
-          totalPullRequestReviewContributions
-          totalRepositoriesWithContributedCommits
-          contributionCalendar {
-            totalContributions
-            weeks {
-              contributionDays {
-                date
-                contributionCount
-                contributionLevel
-              }
-            }
-          }
-          commitContributionsByRepository(maxRepositories: 20) {
-            repository {
+GRAPHQL_PROFILE_FIELDS = """
+    login
+    databaseId
+    avatarUrl
+    url
+    name
+    company
+    websiteUrl
+    location
+    email
+    bio
+    twitterUsername
+    createdAt
+    gists(privacy: PUBLIC) {
+      totalCount
+    }
+    followers {
+      totalCount
+    }
+    following {
+      totalCount
+    }
+    repositories(
+      first: 100
+      ownerAffiliations: OWNER
+      privacy: PUBLIC
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      totalCount
+      nodes {
+        databaseId
+        name
+        nameWithOwner
+        url
+        description
+        isFork
+        createdAt
+        updatedAt
+        pushedAt
+        homepageUrl
+        diskUsage
+        stargazerCount
+        watchers {
+          totalCount
+        }
+        primaryLanguage {
+          name
+        }
+        forkCount
+        issues(states: OPEN) {
+          totalCount
+        }
+        defaultBranchRef {
+          name
+        }
+        repositoryTopics(first: 20) {
+          nodes {
+            topic {
               name
-              nameWithOwner
-              url
-              primaryLanguage {
-                name
-              }
-              stargazerCount
-              description
-            }
-            contributions {
-              totalCount
             }
           }
         }
       }
     }
+"""
+
+GRAPHQL_CONTRIBUTION_FIELDS = """
+      totalCommitContributions
+      totalPullRequestContributions
+      totalIssueContributions
+      totalPullRequestReviewContributions
+      totalRepositoriesWithContributedCommits
+      contributionCalendar {
+        totalContributions
+        weeks {
+          contributionDays {
+            date
+            contributionCount
+            contributionLevel
+          }
+        }
+      }
+      commitContributionsByRepository(maxRepositories: 20) {
+        repository {
+          name
+          nameWithOwner
+          url
+          primaryLanguage {
+            name
+          }
+          stargazerCount
+          description
+        }
+        contributions {
+          totalCount
+        }
+      }
+"""
+
+
+@lru_cache(maxsize=32)
+def build_user_query(years: Tuple[int, ...]) -> str:
+    """Build a profile query with one aliased contributionsCollection per year.
+
+    GitHub allows several aliased selections of the same field in a single
+    query, each returned under its ``_YYYY`` alias. Only single-year queries
+    are sent for now; the tuple leaves room to fetch several years at once.
     """
+    collections = "".join(
+        f'''
+    _{year}: contributionsCollection(from: "{year}-01-01T00:00:00Z", to: "{year}-12-31T23:59:59Z") {{{GRAPHQL_CONTRIBUTION_FIELDS}    }}'''
+        for year in years
+    )
+    query = f"""
+query($username: String!) {{
+  user(login: $username) {{{GRAPHQL_PROFILE_FIELDS}{collections}
+  }}
+}}
+"""
+    # The indentation is a good part of the body; none of the string
+    # literals contain whitespace, so collapsing it is safe
+    return " ".join(query.split())
+
+
+@dataclass(slots=True)
+class GraphQLUserData:
+    user: GitHubUser
+    repos: List[GitHubRepo]
+    contribution_data: ContributionData
+
+
+def _parse_graphql_user(user: Dict[str, Any]) -> GitHubUser:
+    """Map a GraphQL user onto the REST-shaped GitHubUser"""
+    return GitHubUser(
+        login=user["login"],
+        id=user["databaseId"],
+        avatar_url=user["avatarUrl"],
+        html_url=user["url"],
+        name=user.get("name"),
+        company=user.get("company"),
+        blog=user.get("websiteUrl"),
+        location=user.get("location"),
+        email=user.get("email") or None,  # GraphQL returns "" when hidden
+        bio=user.get("bio"),
+        twitter_username=user.get("twitterUsername"),
+        public_repos=user["repositories"]["totalCount"],
+        public_gists=user["gists"]["totalCount"],
+        followers=user["followers"]["totalCount"],
+        following=user["following"]["totalCount"],
+        created_at=user["createdAt"],
+    )
+
+
+def _parse_graphql_repo(node: Dict[str, Any]) -> GitHubRepo:
+    """Map a GraphQL repository node onto the REST-shaped GitHubRepo"""
+    language = node.get("primaryLanguage")
+    branch = node.get("defaultBranchRef")
+    watchers = node.get("watchers")
+    issues = node.get("issues")
+    topics = node.get("repositoryTopics")
+    return GitHubRepo(
+        id=node["databaseId"],
+        name=node["name"],
+        full_name=node["nameWithOwner"],
+        html_url=node["url"],
+        description=node.get("description"),
+        fork=node.get("isFork", False),
+        created_at=node["createdAt"],
+        updated_at=node["updatedAt"],
+        pushed_at=node.get("pushedAt") or node["updatedAt"],
+        homepage=node.get("homepageUrl"),
+        size=node.get("diskUsage") or 0,
+        stargazers_count=node.get("stargazerCount", 0),
+        watchers_count=watchers["totalCount"] if watchers else 0,
+        language=language["name"] if language else None,
+        forks_count=node.get("forkCount", 0),
+        open_issues_count=issues["totalCount"] if issues else 0,
+        default_branch=branch["name"] if branch else "main",
+        topics=tuple(t["topic"]["name"] for t in topics["nodes"]) if topics else _EMPTY,
+    )
+
+
+def _parse_contribution_collection(collection: Dict[str, Any]) -> ContributionData:
+    """Parse a GraphQL contributionsCollection into ContributionData"""
+    cal_data = collection.get("contributionCalendar") or {}
+    day_cls = ContributionDay
+    weeks = tuple(
+        tuple(
+            day_cls(day["date"], day["contributionCount"], day["contributionLevel"])
+            for day in week["contributionDays"]
+        )
+        for week in cal_data.get("weeks", ())
+    )
     
-    from_date = f"{year}-01-01T00:00:00Z"
-    to_date = f"{year}-12-31T23:59:59Z"
+    calendar = ContributionCalendar(
+        total_contributions=cal_data.get("totalContributions", 0),
+        weeks=weeks,
+    )
     
-    try:
-        response = requests.post(
-            GITHUB_GRAPHQL_URL,
-            json={
-                "query": query,
-                "variables": {"username": username, "from": from_date, "to": to_date}
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-        )
-        
-        if not response.ok:
-            return None
-            
-        data = response.json()
+    return ContributionData(
+        total_commit_contributions=collection.get("totalCommitContributions", 0),
+        total_pull_request_contributions=collection.get("totalPullRequestContributions", 0),
+        total_issue_contributions=collection.get("totalIssueContributions", 0),
+        total_pull_request_review_contributions=collection.get("totalPullRequestReviewContributions", 0),
+        total_repositories_with_contributed_commits=collection.get("totalRepositoriesWithContributedCommits", 0),
+        contribution_calendar=calendar,
+        commit_contributions_by_repository=collection.get("commitContributionsByRepository", []),
+    )
+
+
+def _post_user_query(
+    username: str,
+    query: str,
+    token: str,
+    session: Optional[requests.Session],
+) -> Optional[Dict[str, Any]]:
+    """Run a user query and return the user object, or None on any error.
+
+    A rejected token raises instead, since it would fail every other
+    request it was sent with too.
+    """
+    response = _request(
+        session,
+        "POST",
+        GITHUB_GRAPHQL_URL,
+        token=token,
+        json={"query": query, "variables": {"username": username}},
+    )
+    
+    if response.status_code == 401:
+        raise GitHubApiError("Invalid GitHub token", 401, "UNAUTHORIZED")
+    if not response.ok:
+        return None
         
-        if "errors" in data:
-            return None
-            
-        collection = data.get("data", {}).get("user", {}).get("contributionsCollection")
-        if not collection:
+    data = orjson.loads(response.content)
+    
+    if "errors" in data:
+        return None
+    
+    payload = data.get("data")
+    return payload.get("user") if payload else None
+
+
+def fetch_user_data_graphql(
+    username: str, 
+    year: int, 
+    token: str,
+    session: Optional[requests.Session] = None,
+) -> Optional[GraphQLUserData]:
+    """Fetch profile, repositories and contribution data in one GraphQL request"""
+    try:
+        user = _post_user_query(username, build_user_query((year,)), token, session)
+        if not user or not user.get(f"_{year}"):
             return None
         
-        # Parse contribution calendar
-        cal_data = collection.get("contributionCalendar", {})
-        weeks = []
-        for week in cal_data.get("weeks", []):
-            week_days = []
-            for day in week.get("contributionDays", []):
-                week_days.append(ContributionDay(
-                    date=day["date"],
-                    contribution_count=day["contributionCount"],
-                    contribution_level=day["contributionLevel"],
-                ))
-            weeks.append(week_days)
-        
-        calendar = ContributionCalendar(
-            total_contributions=cal_data.get("totalContributions", 0),
-            weeks=weeks,
-        )
-        
-        return ContributionData(
-            total_commit_contributions=collection.get("totalCommitContributions", 0),
-            total_pull_request_contributions=collection.get("totalPullRequestContributions", 0),
-            total_issue_contributions=collection.get("totalIssueContributions", 0),
-            total_pull_request_review_contributions=collection.get("totalPullRequestReviewContributions", 0),
-            total_repositories_with_contributed_commits=collection.get("totalRepositoriesWithContributedCommits", 0),
-            contribution_calendar=calendar,
-            commit_contributions_by_repository=collection.get("commitContributionsByRepository", []),
+        return GraphQLUserData(
+            user=_parse_graphql_user(user),
+            repos=[_parse_graphql_repo(node) for node in user["repositories"]["nodes"]],
+            contribution_data=_parse_contribution_collection(user[f"_{year}"]),
         )
         
+    except GitHubApiError:
+        raise
     except Exception:
         return None
 
 
-@dataclass
+# Event types the insights distinguish, coded 1..n in the event columns;
+# every other type is coded 0
+EVENT_TYPE_CODES: Dict[str, int] = {
+    "PushEvent": 1,
+    "PullRequestEvent": 2,
+    "IssuesEvent": 3,
+    "PullRequestReviewEvent": 4,
+}
+
+
+@dataclass(slots=True)
 class AllGitHubData:
     user: GitHubUser
     repos: List[GitHubRepo]
     events: List[GitHubEvent]
     contribution_data: Optional[ContributionData]
     contribution_calendar: Optional[ContributionCalendar]
+    
+    # Column views of the events and repos, extracted once so the insights
+    # can filter and tally them vectorised. Events are put in ascending time
+    # order (the API lists them newest first), so any year is a contiguous
+    # slice of the event columns
+    event_time: np.ndarray = field(init=False, repr=False, compare=False)  # datetime64[s], UTC
+    event_year: np.ndarray = field(init=False, repr=False, compare=False)
+    event_type: np.ndarray = field(init=False, repr=False, compare=False)  # EVENT_TYPE_CODES
+    event_repo: np.ndarray = field(init=False, repr=False, compare=False)  # repo full names
+    event_commits: np.ndarray = field(init=False, repr=False, compare=False)  # push commits, else 0
+    repo_year: np.ndarray = field(init=False, repr=False, compare=False)  # year created
+    
+    def __post_init__(self) -> None:
+        # Timestamps are ISO-8601 UTC, so they sort chronologically as strings
+        events = self.events = sorted(self.events, key=lambda e: e.created_at)
+        codes = EVENT_TYPE_CODES
+        # created_at is "YYYY-MM-DDTHH:MM:SSZ"; NumPy won't parse the Z suffix
+        self.event_time = np.array([e.created_at[:19] for e in events], dtype='datetime64[s]')
+        self.event_year = self.event_time.astype('datetime64[Y]').view('i8') + 1970
+        self.event_type = np.array([codes.get(e.type, 0) for e in events], dtype=np.int8)
+        self.event_repo = np.array([e.repo.get("name", "") for e in events], dtype=object)
+        # A push without a commit list still counts as one commit
+        self.event_commits = np.array(
+            [len(e.payload.get("commits") or ()) or 1 if e.type == "PushEvent" else 0 for e in events],
+            dtype=np.int64,
+        )
+        self.repo_year = np.array([int(r.created_at[:4]) for r in self.repos], dtype=np.int64)
 
 
 def fetch_all_github_data(
     username: str, 
     year: int, 
-    token: Optional[str] = None
+    token: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> AllGitHubData:
-    """Fetch all GitHub data for a user"""
-    user = fetch_user_profile(username)
-    repos = fetch_user_repos(username)
-    events = fetch_user_events(username)
-    
-    contribution_data = None
-    if token:
-        contribution_data = fetch_contribution_data_graphql(username, year, token)
-    
-    contribution_calendar = fetch_contribution_calendar_fallback(username, year)
+    """Fetch all GitHub data for a user, requesting the endpoints concurrently"""
+    # The endpoints are independent and I/O-bound, so overlap them; the pool
+    # size caps in-flight requests to stay clear of secondary rate limits,
+    # so the event pages are queued on it directly rather than through
+    # fetch_user_events, which would open a pool of its own.
+    # With a token, the profile, repositories and contribution calendar come
+    # from the same GraphQL request as the contribution data; REST and the
+    # fallback calendar API are only used if that request fails (which is
+    # also how a missing user is reported). If it fails because the token is
+    # rejected, everything is fetched again without it, as it would be had
+    # no token been given.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        event_pages = _submit_event_pages(executor, username, session=session, token=token)
+        graphql_future = (
+            executor.submit(fetch_user_data_graphql, username, year, token, session=session)
+            if token else None
+        )
+        
+        try:
+            graphql_data = graphql_future.result() if graphql_future else None
+        except GitHubApiError:
+            graphql_data = None
+            token = None
+            event_pages = _submit_event_pages(executor, username, session=session)
+        
+        if graphql_data:
+            user = graphql_data.user
+            repos = graphql_data.repos
+            contribution_data = graphql_data.contribution_data
+            contribution_calendar = contribution_data.contribution_calendar
+        else:
+            calendar_future = executor.submit(
+                fetch_contribution_calendar_fallback, username, year, session=session
+            )
+            user_future = executor.submit(fetch_user_profile, username, session=session, token=token)
+            repos_future = executor.submit(fetch_user_repos, username, session=session, token=token)
+            user = user_future.result()
+            repos = repos_future.result()
+            contribution_data = None
+            contribution_calendar = calendar_future.result()
+        
+        events = _collect_events(event_pages)
     
     return AllGitHubData(
         user=user,
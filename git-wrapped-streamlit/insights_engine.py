@@ -3,14 +3,19 @@ Insights Engine - Data Processing
 Port of src/services/insightsEngine.ts
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Tuple, Callable, Set, TypedDict
 from datetime import datetime
 from collections import Counter
+import heapq
+
+import numpy as np
 
 from github_api import (
+    EVENT_TYPE_CODES,
     AllGitHubData, 
-    GitHubEvent, 
     GitHubRepo, 
     ContributionCalendar,
     ContributionData,
@@ -54,15 +59,18 @@ LANGUAGE_COLORS = {
 }
 
 
+DEFAULT_LANGUAGE_COLOR = '#8b949e'
+
+
 def get_language_color(language: str) -> str:
-    return LANGUAGE_COLORS.get(language, '#8b949e')
+    return LANGUAGE_COLORS.get(language, DEFAULT_LANGUAGE_COLOR)
 
 
 # ========================================
 # Data Classes
 # ========================================
 
-@dataclass
+@dataclass(slots=True)
 class LanguageStat:
     name: str
     count: int
@@ -70,7 +78,7 @@ class LanguageStat:
     color: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoStat:
     name: str
     full_name: str
@@ -81,21 +89,21 @@ class RepoStat:
     description: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthlyActivity:
     month: str
     year: int
     contributions: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonalityTrait:
     name: str
     value: int  # 0-100
     label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeveloperPersonality:
     title: str
     emoji: str
@@ -103,7 +111,7 @@ class DeveloperPersonality:
     traits: List[PersonalityTrait]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WrappedInsights:
     # Basic Stats
     total_contributions: int
@@ -145,57 +153,136 @@ class WrappedInsights:
     personality: DeveloperPersonality
 
 
+# ========================================
+# Intermediate Results
+# ========================================
+
+class EventIndex(TypedDict):
+    type_counts: Dict[str, int]
+    repos: Set[str]
+    push_commits: int
+
+
+class BasicStats(TypedDict):
+    total_contributions: int
+    total_commits: int
+    total_prs: int
+    total_issues: int
+    total_reviews: int
+    repositories_contributed_to: int
+
+
+class LanguageSummary(TypedDict):
+    top_languages: List[LanguageStat]
+    total_languages: int
+
+
+class ActivityPatterns(TypedDict):
+    most_productive_day: str
+    most_productive_hour: int
+    peak_hour_range: str
+    activity_by_day: Dict[str, int]
+    activity_by_hour: Dict[int, int]
+    monthly_activity: List[MonthlyActivity]
+
+
+class Streaks(TypedDict):
+    longest_streak: int
+    current_streak: int
+    total_active_days: int
+
+
+class Scores(TypedDict):
+    solo_vs_team_score: int
+    bug_slayer_score: int
+
+
+class PersonaFlags(TypedDict):
+    is_night_owl: bool
+    is_early_bird: bool
+    is_polyglot: bool
+    is_weekend_warrior: bool
+    is_solo: bool
+    bug_slayer_score: int
+    n_languages: int
+
+
+# ========================================
+# Calendar Arrays
+# ========================================
+
+def flatten_calendar(calendar: ContributionCalendar) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten a contribution calendar into date-sorted (dates, counts) arrays"""
+    days = [day for week in calendar.weeks for day in week]
+    dates = np.array([day.date[:10] for day in days], dtype='datetime64[D]')
+    counts = np.fromiter((day.contribution_count for day in days), dtype=np.int64, count=len(days))
+    order = np.argsort(dates, kind='stable')
+    return dates[order], counts[order]
+
+
+def weekday_index(dates: np.ndarray) -> np.ndarray:
+    """Weekday of each datetime64[D], Sunday = 0 (1970-01-01 was a Thursday)"""
+    return (dates.view('i8') + 4) % 7
+
+
+def bucket_events(times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count datetime64[s] times per UTC hour, weekday (Sunday = 0) and month"""
+    seconds = times.view('i8')
+    by_hour = np.bincount(seconds // 3600 % 24, minlength=24)
+    by_weekday = np.bincount((seconds // 86400 + 4) % 7, minlength=7)
+    by_month = np.bincount(times.astype('datetime64[M]').view('i8') % 12, minlength=12)
+    return by_hour, by_weekday, by_month
+
+
+def year_slice(dates: np.ndarray, counts: np.ndarray, year: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The days of ``year`` from date-sorted calendar arrays"""
+    lo, hi = np.searchsorted(dates, np.array([f'{year}-01-01', f'{year + 1}-01-01'], dtype='datetime64[D]'))
+    return dates[lo:hi], counts[lo:hi]
+
+
 # ========================================
 # Calculation Functions
 # ========================================
 
+def index_events(event_type: np.ndarray, event_repo: np.ndarray, event_commits: np.ndarray) -> EventIndex:
+    """Tally event types, push commits and contributed repos from event columns"""
+    codes = np.bincount(event_type, minlength=len(EVENT_TYPE_CODES) + 1)
+    
+    return {
+        'type_counts': {name: int(codes[code]) for name, code in EVENT_TYPE_CODES.items()},
+        # Only the coded types count towards repos contributed to
+        'repos': set(event_repo[event_type > 0].tolist()),
+        'push_commits': int(event_commits.sum()),
+    }
+
+
 def calculate_basic_stats(
-    events: List[GitHubEvent],
+    event_index: EventIndex,
     contribution_data: Optional[ContributionData],
     contribution_calendar: Optional[ContributionCalendar],
-) -> Dict[str, Any]:
+    calendar_counts: Optional[np.ndarray] = None,
+) -> BasicStats:
     """Calculate basic contribution stats"""
-    commits = 0
-    prs = 0
-    issues = 0
-    reviews = 0
-    repos_set = set()
-    
-    # Calculate commits from contribution calendar (most accurate)
-    calendar_commits = 0
-    if contribution_calendar:
-        for week in contribution_calendar.weeks:
-            for day in week:
-                calendar_commits += day.contribution_count
-    
-    # Process events
-    for event in events:
-        event_type = event.type
-        if event_type == 'PushEvent':
-            payload_commits = event.payload.get('commits', [])
-            commits += len(payload_commits) if payload_commits else 1
-            repos_set.add(event.repo.get('name', ''))
-        elif event_type == 'PullRequestEvent':
-            prs += 1
-            repos_set.add(event.repo.get('name', ''))
-        elif event_type == 'IssuesEvent':
-            issues += 1
-            repos_set.add(event.repo.get('name', ''))
-        elif event_type == 'PullRequestReviewEvent':
-            reviews += 1
-            repos_set.add(event.repo.get('name', ''))
-    
     # Prefer GraphQL data if available
     if contribution_data:
         return {
             'total_contributions': contribution_data.contribution_calendar.total_contributions,
-            'commits': contribution_data.total_commit_contributions,
-            'prs': contribution_data.total_pull_request_contributions,
-            'issues': contribution_data.total_issue_contributions,
-            'reviews': contribution_data.total_pull_request_review_contributions,
-            'repos_contributed_to': contribution_data.total_repositories_with_contributed_commits,
+            'total_commits': contribution_data.total_commit_contributions,
+            'total_prs': contribution_data.total_pull_request_contributions,
+            'total_issues': contribution_data.total_issue_contributions,
+            'total_reviews': contribution_data.total_pull_request_review_contributions,
+            'repositories_contributed_to': contribution_data.total_repositories_with_contributed_commits,
         }
     
+    type_counts = event_index['type_counts']
+    commits = event_index['push_commits']
+    prs = type_counts['PullRequestEvent']
+    issues = type_counts['IssuesEvent']
+    reviews = type_counts['PullRequestReviewEvent']
+    
+    # Calculate commits from contribution calendar (most accurate)
+    calendar_commits = int(calendar_counts.sum()) if calendar_counts is not None else 0
+    
     # Use calendar commits if available
     final_commits = calendar_commits if calendar_commits > 0 else commits
     
@@ -203,123 +290,155 @@ def calculate_basic_stats(
     
     return {
         'total_contributions': total,
-        'commits': final_commits,
-        'prs': prs,
-        'issues': issues,
-        'reviews': reviews,
-        'repos_contributed_to': len(repos_set),
+        'total_commits': final_commits,
+        'total_prs': prs,
+        'total_issues': issues,
+        'total_reviews': reviews,
+        'repositories_contributed_to': len(event_index['repos']),
     }
 
 
-def calculate_language_stats(repos: List[GitHubRepo]) -> Dict[str, Any]:
-    """Calculate language statistics from repositories"""
-    language_counts: Counter = Counter()
-    
-    for repo in repos:
-        if repo.language and not repo.fork:
-            language_counts[repo.language] += 1
-    
+TOP_REPO_COUNT = 6
+
+
+def summarise_languages(language_counts: Counter) -> LanguageSummary:
+    """Top languages and language count from per-language repo counts"""
     total_repos = sum(language_counts.values())
     if total_repos == 0:
         return {'top_languages': [], 'total_languages': 0}
     
-    languages = [
+    # Only the top eight are shown, so most_common selects them with a heap
+    # rather than sorting every language
+    color = LANGUAGE_COLORS.get
+    top_languages = [
         LanguageStat(
             name=name,
             count=count,
             percentage=round((count / total_repos) * 100),
-            color=get_language_color(name),
+            color=color(name, DEFAULT_LANGUAGE_COLOR),
         )
-        for name, count in language_counts.most_common()
+        for name, count in language_counts.most_common(8)
     ]
     
     return {
-        'top_languages': languages[:8],
-        'total_languages': len(languages),
+        'top_languages': top_languages,
+        'total_languages': len(language_counts),
     }
 
 
+def calculate_language_stats(repos: List[GitHubRepo]) -> LanguageSummary:
+    """Calculate language statistics from repositories"""
+    return scan_repos(repos, None)[0]
+
+
+def _contributed_repo_stats(contribution_data: ContributionData) -> List[RepoStat]:
+    """Top repositories by commits, from GraphQL commit contributions"""
+    repo_stats = []
+    for item in contribution_data.commit_contributions_by_repository:
+        repo = item.get('repository', {})
+        contributions = item.get('contributions', {})
+        repo_stats.append(RepoStat(
+            name=repo.get('name', ''),
+            full_name=repo.get('nameWithOwner', ''),
+            url=repo.get('url', ''),
+            stars=repo.get('stargazerCount', 0),
+            commits=contributions.get('totalCount', 0),
+            language=repo.get('primaryLanguage', {}).get('name') if repo.get('primaryLanguage') else None,
+            description=repo.get('description'),
+        ))
+    repo_stats.sort(key=lambda x: x.commits, reverse=True)
+    return repo_stats[:TOP_REPO_COUNT]
+
+
+def _repo_stat(repo: GitHubRepo) -> RepoStat:
+    return RepoStat(
+        name=repo.name,
+        full_name=repo.full_name,
+        url=repo.html_url,
+        stars=repo.stargazers_count,
+        commits=0,
+        language=repo.language,
+        description=repo.description,
+    )
+
+
+def _top_repo_key(repo: GitHubRepo) -> Tuple[int, str]:
+    # ISO-8601 UTC timestamps sort chronologically as strings, so the push
+    # time breaks ties between equal star counts without being parsed
+    return repo.stargazers_count, repo.pushed_at or ''
+
+
 def calculate_top_repos(
     repos: List[GitHubRepo],
     contribution_data: Optional[ContributionData],
 ) -> List[RepoStat]:
     """Calculate top repositories"""
-    if contribution_data and contribution_data.commit_contributions_by_repository:
-        repo_stats = []
-        for item in contribution_data.commit_contributions_by_repository:
-            repo = item.get('repository', {})
-            contributions = item.get('contributions', {})
-            repo_stats.append(RepoStat(
-                name=repo.get('name', ''),
-                full_name=repo.get('nameWithOwner', ''),
-                url=repo.get('url', ''),
-                stars=repo.get('stargazerCount', 0),
-                commits=contributions.get('totalCount', 0),
-                language=repo.get('primaryLanguage', {}).get('name') if repo.get('primaryLanguage') else None,
-                description=repo.get('description'),
-            ))
-        repo_stats.sort(key=lambda x: x.commits, reverse=True)
-        return repo_stats[:6]
-    
-    # Fallback: sort by stars and recent activity
-    non_fork_repos = [r for r in repos if not r.fork]
-    non_fork_repos.sort(
-        key=lambda r: r.stargazers_count + (datetime.fromisoformat(r.pushed_at.replace('Z', '+00:00')).timestamp() / 1e12),
-        reverse=True
-    )
+    return scan_repos(repos, contribution_data)[1]
+
+
+def scan_repos(
+    repos: List[GitHubRepo],
+    contribution_data: Optional[ContributionData],
+) -> Tuple[LanguageSummary, List[RepoStat]]:
+    """Language statistics and top repositories in one pass over repos.
+
+    Without GraphQL commit contributions, the top repositories are the
+    non-fork ones with the most stars, most recently pushed first on ties.
+    """
+    language_counts: Counter = Counter()
+    contributed = bool(contribution_data and contribution_data.commit_contributions_by_repository)
+    # Min-heap of the best non-fork repos so far; the negated position makes
+    # earlier repos win ties, as in a stable sort, and keeps keys unique
+    heap: List[Tuple[Tuple[int, str], int, GitHubRepo]] = []
+    
+    for position, repo in enumerate(repos):
+        if repo.fork:
+            continue
+        if repo.language:
+            language_counts[repo.language] += 1
+        if not contributed:
+            # Only six are shown, so keep a heap instead of sorting them all
+            entry = (_top_repo_key(repo), -position, repo)
+            if len(heap) < TOP_REPO_COUNT:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
+    
+    if contributed:
+        top_repos = _contributed_repo_stats(contribution_data)
+    else:
+        top_repos = [_repo_stat(repo) for _, _, repo in sorted(heap, reverse=True)]
     
-    return [
-        RepoStat(
-            name=repo.name,
-            full_name=repo.full_name,
-            url=repo.html_url,
-            stars=repo.stargazers_count,
-            commits=0,
-            language=repo.language,
-            description=repo.description,
-        )
-        for repo in non_fork_repos[:6]
-    ]
+    return summarise_languages(language_counts), top_repos
 
 
 def calculate_activity_patterns(
-    events: List[GitHubEvent],
-    calendar: Optional[ContributionCalendar],
+    event_times: np.ndarray,
+    calendar_days: Optional[Tuple[np.ndarray, np.ndarray]],
     year: int,
-) -> Dict[str, Any]:
+) -> ActivityPatterns:
     """Calculate activity patterns by day, hour, and month"""
-    day_activity = {i: 0 for i in range(7)}
-    hour_activity = {i: 0 for i in range(24)}
-    monthly_contributions = {i: 0 for i in range(12)}
-    
-    # Process events for hour activity
-    for event in events:
-        date = datetime.fromisoformat(event.created_at.replace('Z', '+00:00'))
-        hour_activity[date.hour] += 1
-    
-    # Use contribution calendar for day and monthly stats
-    if calendar:
-        for week in calendar.weeks:
-            for day in week:
-                date = datetime.fromisoformat(day.date.replace('Z', '+00:00') if 'Z' in day.date else day.date)
-                if date.year == year and day.contribution_count > 0:
-                    # Sunday = 0, Monday = 1, etc.
-                    weekday = (date.weekday() + 1) % 7
-                    day_activity[weekday] += day.contribution_count
-                    monthly_contributions[date.month - 1] += day.contribution_count
-    else:
-        # Fallback to events
-        for event in events:
-            date = datetime.fromisoformat(event.created_at.replace('Z', '+00:00'))
-            weekday = (date.weekday() + 1) % 7
-            day_activity[weekday] += 1
-            monthly_contributions[date.month - 1] += 1
+    by_hour, by_weekday, by_month = bucket_events(event_times)
+    
+    # Use contribution calendar for day and monthly stats, falling back to
+    # the events' own weekday and month buckets
+    if calendar_days is not None:
+        dates, counts = year_slice(*calendar_days, year)
+        months = dates.astype('datetime64[M]').astype(int) % 12
+        by_weekday = np.bincount(weekday_index(dates), weights=counts, minlength=7).astype(np.int64)
+        by_month = np.bincount(months, weights=counts, minlength=12).astype(np.int64)
+    
+    # The histograms stay arrays until here; argmax, like max() over the
+    # dicts before, picks the earliest of any tied buckets
+    hour_activity = dict(enumerate(by_hour.tolist()))
+    day_activity = dict(enumerate(by_weekday.tolist()))
+    monthly_contributions = dict(enumerate(by_month.tolist()))
     
     # Find most productive day
-    most_productive_day = max(day_activity, key=day_activity.get)
+    most_productive_day = int(by_weekday.argmax())
     
     # Find most productive hour
-    most_productive_hour = max(hour_activity, key=hour_activity.get)
+    most_productive_hour = int(by_hour.argmax())
     
     # Calculate peak hour range
     peak_start = max(0, most_productive_hour - 1)
@@ -353,77 +472,92 @@ def calculate_activity_patterns(
     }
 
 
-def calculate_streaks(calendar: Optional[ContributionCalendar]) -> Dict[str, int]:
+def calculate_streaks(calendar_days: Optional[Tuple[np.ndarray, np.ndarray]]) -> Streaks:
     """Calculate contribution streaks"""
-    if not calendar:
+    if calendar_days is None:
         return {'longest_streak': 0, 'current_streak': 0, 'total_active_days': 0}
     
-    longest_streak = 0
+    dates, counts = calendar_days
+    active = counts > 0
+    
+    # Run-length encode the active days: padded with inactive days, the
+    # edges alternate between a run's start and one past its end
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], active.view(np.int8), [0]))))
+    run_starts = edges[0::2]
+    run_ends = edges[1::2]
+    lengths = run_ends - run_starts
+    
+    longest_streak = int(lengths.max()) if lengths.size else 0
+    
+    # The final run is still current if it reaches today or yesterday
     current_streak = 0
-    temp_streak = 0
-    total_active_days = 0
-    
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    # Flatten contribution days
-    all_days = []
-    for week in calendar.weeks:
-        all_days.extend(week)
-    
-    # Sort by date
-    all_days.sort(key=lambda d: d.date)
-    
-    for i, day in enumerate(all_days):
-        day_date = datetime.fromisoformat(day.date.replace('Z', '+00:00') if 'Z' in day.date else day.date)
-        day_date = day_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
-        
-        if day.contribution_count > 0:
-            total_active_days += 1
-            temp_streak += 1
-            
-            # Check if this is today or yesterday for current streak
-            diff_days = (today - day_date).days
-            if diff_days <= 1:
-                current_streak = temp_streak
-        else:
-            longest_streak = max(longest_streak, temp_streak)
-            temp_streak = 0
-    
-    longest_streak = max(longest_streak, temp_streak)
+    yesterday = np.datetime64(datetime.now().date(), 'D') - 1
+    if lengths.size and dates[run_ends[-1] - 1] >= yesterday:
+        current_streak = int(lengths[-1])
     
     return {
         'longest_streak': longest_streak,
         'current_streak': current_streak,
-        'total_active_days': total_active_days,
+        'total_active_days': int(active.sum()),
     }
 
 
 def calculate_scores(
-    events: List[GitHubEvent],
+    event_index: EventIndex,
     repos: List[GitHubRepo],
-) -> Dict[str, int]:
+) -> Scores:
     """Calculate solo vs team and bug slayer scores"""
     # Solo vs Team: based on fork ratio
-    own_repos = [r for r in repos if not r.fork]
-    forked_repos = [r for r in repos if r.fork]
-    total = len(own_repos) + len(forked_repos)
-    solo_score = round((len(own_repos) / max(1, total)) * 100) if total > 0 else 50
+    total = len(repos)
+    own_repos = total - sum(r.fork for r in repos)
+    solo_score = round((own_repos / max(1, total)) * 100) if total > 0 else 50
     
     # Bug Slayer: ratio of issues to PRs
-    issues = sum(1 for e in events if e.type == 'IssuesEvent')
-    prs = sum(1 for e in events if e.type == 'PullRequestEvent')
+    issues = event_index['type_counts']['IssuesEvent']
+    prs = event_index['type_counts']['PullRequestEvent']
     bug_slayer_score = round((issues / (issues + prs)) * 100) if (issues + prs) > 0 else 50
     
     return {
-        'solo_score': solo_score,
+        'solo_vs_team_score': solo_score,
         'bug_slayer_score': bug_slayer_score,
     }
 
 
+# Personality titles, first match wins
+PERSONA_TITLES: List[Tuple[Callable[[PersonaFlags], bool], Tuple[str, str, str]]] = [
+    (
+        lambda f: f['is_night_owl'] and f['is_polyglot'],
+        ('Nocturnal Polyglot', '🦉', 'A versatile night owl who masters multiple languages under the moonlight.'),
+    ),
+    (
+        lambda f: f['is_early_bird'] and f['is_solo'],
+        ('Dawn Pioneer', '🌅', 'An independent creator who catches bugs before anyone else wakes up.'),
+    ),
+    (
+        lambda f: f['is_weekend_warrior'] and f['bug_slayer_score'] > 60,
+        ('Weekend Bug Hunter', '🐛', 'A dedicated problem solver who squashes bugs even on their days off.'),
+    ),
+    (
+        lambda f: f['is_polyglot'] and not f['is_solo'],
+        ('Open Source Champion', '🏆', 'A collaborative polyglot who contributes across the ecosystem.'),
+    ),
+    (
+        lambda f: f['is_solo'] and f['n_languages'] <= 2,
+        ('Deep Specialist', '🎯', 'A focused expert who has mastered their chosen technology stack.'),
+    ),
+    (
+        lambda f: f['is_night_owl'] and f['is_weekend_warrior'],
+        ('Code Ninja', '🥷', 'Strikes when least expected, codes through nights and weekends.'),
+    ),
+]
+
+DEFAULT_PERSONA = ('Code Crafter', '👨‍💻', 'A balanced developer with diverse skills.')
+
+
 def calculate_personality(
     repos: List[GitHubRepo],
-    activity: Dict[str, Any],
-    scores: Dict[str, int],
+    activity: ActivityPatterns,
+    scores: Scores,
 ) -> DeveloperPersonality:
     """Calculate developer personality profile"""
     traits = []
@@ -476,7 +610,7 @@ def calculate_personality(
     ))
     
     # Collaboration trait
-    solo_score = scores['solo_score']
+    solo_score = scores['solo_vs_team_score']
     is_solo = solo_score > 70
     traits.append(PersonalityTrait(
         name='Solo Coder' if is_solo else 'Team Player',
@@ -485,35 +619,19 @@ def calculate_personality(
     ))
     
     # Determine title
-    title = 'Code Crafter'
-    emoji = '👨‍💻'
-    description = 'A balanced developer with diverse skills.'
-    bug_slayer_score = scores['bug_slayer_score']
-    
-    if is_night_owl and is_polyglot:
-        title = 'Nocturnal Polyglot'
-        emoji = '🦉'
-        description = 'A versatile night owl who masters multiple languages under the moonlight.'
-    elif is_early_bird and is_solo:
-        title = 'Dawn Pioneer'
-        emoji = '🌅'
-        description = 'An independent creator who catches bugs before anyone else wakes up.'
-    elif is_weekend_warrior and bug_slayer_score > 60:
-        title = 'Weekend Bug Hunter'
-        emoji = '🐛'
-        description = 'A dedicated problem solver who squashes bugs even on their days off.'
-    elif is_polyglot and not is_solo:
-        title = 'Open Source Champion'
-        emoji = '🏆'
-        description = 'A collaborative polyglot who contributes across the ecosystem.'
-    elif is_solo and len(languages) <= 2:
-        title = 'Deep Specialist'
-        emoji = '🎯'
-        description = 'A focused expert who has mastered their chosen technology stack.'
-    elif is_night_owl and is_weekend_warrior:
-        title = 'Code Ninja'
-        emoji = '🥷'
-        description = 'Strikes when least expected, codes through nights and weekends.'
+    flags: PersonaFlags = {
+        'is_night_owl': is_night_owl,
+        'is_early_bird': is_early_bird,
+        'is_polyglot': is_polyglot,
+        'is_weekend_warrior': is_weekend_warrior,
+        'is_solo': is_solo,
+        'bug_slayer_score': scores['bug_slayer_score'],
+        'n_languages': len(languages),
+    }
+    title, emoji, description = next(
+        (persona for matches, persona in PERSONA_TITLES if matches(flags)),
+        DEFAULT_PERSONA,
+    )
     
     return DeveloperPersonality(
         title=title,
@@ -529,73 +647,51 @@ def calculate_personality(
 
 def calculate_insights(data: AllGitHubData, year: int) -> WrappedInsights:
     """Calculate all insights from GitHub data"""
-    # Filter events for selected year
-    year_events = [
-        e for e in data.events
-        if datetime.fromisoformat(e.created_at.replace('Z', '+00:00')).year == year
-    ]
-    
-    # Filter repos created in selected year
-    year_repos = [
-        r for r in data.repos
-        if datetime.fromisoformat(r.created_at.replace('Z', '+00:00')).year == year
-    ]
-    
-    # Calculate stats
-    basic_stats = calculate_basic_stats(
-        year_events, 
-        data.contribution_data, 
-        data.contribution_calendar
+    # Slice out the selected year; the event columns were parsed at load and
+    # are in time order
+    year_rows = slice(*np.searchsorted(data.event_year, (year, year + 1)))
+    event_times = data.event_time[year_rows]
+    
+    # Repos created in selected year; only their number is reported
+    new_repositories_created = int(np.count_nonzero(data.repo_year == year))
+    
+    # Flatten the calendar once for the array-based helpers
+    calendar_days = flatten_calendar(data.contribution_calendar) if data.contribution_calendar else None
+    
+    # Calculate stats; events are tallied from the year's rows of the columns
+    event_index = index_events(
+        data.event_type[year_rows],
+        data.event_repo[year_rows],
+        data.event_commits[year_rows],
     )
-    language_stats = calculate_language_stats(data.repos)
-    top_repos = calculate_top_repos(data.repos, data.contribution_data)
+    language_stats, top_repos = scan_repos(data.repos, data.contribution_data)
     activity_patterns = calculate_activity_patterns(
-        year_events, 
-        data.contribution_calendar, 
+        event_times, 
+        calendar_days, 
         year
     )
-    streaks = calculate_streaks(data.contribution_calendar)
-    scores = calculate_scores(year_events, data.repos)
+    streaks = calculate_streaks(calendar_days)
+    scores = calculate_scores(event_index, data.repos)
     personality = calculate_personality(data.repos, activity_patterns, scores)
     
-    # Prefer GraphQL data for totals
-    if data.contribution_data:
-        total_contributions = data.contribution_data.contribution_calendar.total_contributions
-        total_commits = data.contribution_data.total_commit_contributions
-        total_prs = data.contribution_data.total_pull_request_contributions
-        total_issues = data.contribution_data.total_issue_contributions
-        total_reviews = data.contribution_data.total_pull_request_review_contributions
-        repos_contributed_to = data.contribution_data.total_repositories_with_contributed_commits
-    else:
-        total_contributions = basic_stats['total_contributions']
-        total_commits = basic_stats['commits']
-        total_prs = basic_stats['prs']
-        total_issues = basic_stats['issues']
-        total_reviews = basic_stats['reviews']
-        repos_contributed_to = basic_stats['repos_contributed_to']
+    # GraphQL totals when available, otherwise event and calendar based ones;
+    # only the latter need the event index and calendar counts
+    totals = calculate_basic_stats(
+        event_index, 
+        data.contribution_data, 
+        data.contribution_calendar,
+        calendar_days[1] if calendar_days else None,
+    )
     
+    # The intermediate results are keyed by WrappedInsights field names
     return WrappedInsights(
-        total_contributions=total_contributions,
-        total_commits=total_commits,
-        total_prs=total_prs,
-        total_issues=total_issues,
-        total_reviews=total_reviews,
-        repositories_contributed_to=repos_contributed_to,
-        new_repositories_created=len(year_repos),
+        **totals,
+        new_repositories_created=new_repositories_created,
         top_repositories=top_repos,
-        top_languages=language_stats['top_languages'],
-        total_languages=language_stats['total_languages'],
-        most_productive_day=activity_patterns['most_productive_day'],
-        most_productive_hour=activity_patterns['most_productive_hour'],
-        peak_hour_range=activity_patterns['peak_hour_range'],
-        activity_by_day=activity_patterns['activity_by_day'],
-        activity_by_hour=activity_patterns['activity_by_hour'],
-        monthly_activity=activity_patterns['monthly_activity'],
-        longest_streak=streaks['longest_streak'],
-        current_streak=streaks['current_streak'],
-        total_active_days=streaks['total_active_days'],
-        solo_vs_team_score=scores['solo_score'],
-        bug_slayer_score=scores['bug_slayer_score'],
+        **language_stats,
+        **activity_patterns,
+        **streaks,
+        **scores,
         contribution_calendar=data.contribution_calendar,
         personality=personality,
     )